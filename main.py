@@ -1,8 +1,102 @@
 import json
+import os
+import sys
+from contextlib import contextmanager
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 from typing import List, Dict, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson не установлен - используем стандартный json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson не установлен - файл JSON разбирается целиком
+    ijson = None
+
+# Размер буфера файлового ввода-вывода (1 МиБ)
+IO_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def _atomic_write(filename: str):
+    """Запись во временный файл с атомарной заменой целевого файла при успехе"""
+    tmp_filename = filename + '.tmp'
+    try:
+        with open(tmp_filename, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            yield f
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+
+
+def _json_scalar(value) -> bytes:
+    """Сериализация скалярного значения в JSON (UTF-8)"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+
+def _json_emitter(*fields):
+    """Декоратор: генерирует метод _to_json_bytes по фиксированной схеме полей
+
+    fields - кортежи (ключ, атрибут, тип); тип int, str или bytes (уже готовый JSON).
+    Результат совпадает с JSON словаря to_dict с отступом в 2 пробела.
+    """
+    def decorate(cls):
+        parts = []
+        for key, attr, kind in fields:
+            value = f"self.{attr}"
+            if kind is int:
+                expr = f"(str({value}).encode() if type({value}) is int else _json_scalar({value}))"
+            elif kind is bytes:
+                expr = value
+            else:
+                expr = f"_json_scalar({value})"
+            parts.append(f"b'  \"{key}\": ' + {expr}")
+        source = (
+            "def _to_json_bytes(self):\n"
+            "    return b'{\\n' + b',\\n'.join((\n"
+            + "".join(f"        {part},\n" for part in parts)
+            + "    )) + b'\\n}'\n"
+        )
+        namespace = {'_json_scalar': _json_scalar}
+        exec(source, namespace)
+        cls._to_json_bytes = namespace['_to_json_bytes']
+        return cls
+    return decorate
+
+
+def _checked_json_events(events, section: str):
+    """Проверка потока событий ijson: корень - объект, раздел section - массив"""
+    events = iter(events)
+    prefix, event, value = next(events)
+    if event != 'start_map':
+        raise InvalidDataError("Корневой элемент JSON должен быть объектом")
+    yield prefix, event, value
+    for prefix, event, value in events:
+        if prefix == section and event not in ('start_array', 'end_array'):
+            raise InvalidDataError(f"Раздел {section} должен быть массивом")
+        yield prefix, event, value
+
+
+def _time_to_minutes(value) -> Optional[int]:
+    """Перевод строки времени ЧЧ:ММ (00:00-23:59) в минуты от полуночи, иначе None"""
+    if (isinstance(value, str) and len(value) == 5 and value[2] == ':'
+            and value[:2].isdigit() and value[3:].isdigit() and value.isascii()):
+        hours, minutes = int(value[:2]), int(value[3:])
+        if hours < 24 and minutes < 60:
+            return hours * 60 + minutes
+    return None
+
+
+def _minutes_to_time(minutes: int) -> str:
+    """Перевод минут от полуночи во время формата ЧЧ:ММ"""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
 
 # Собственные исключения
 class TransportError(Exception):
@@ -31,9 +125,13 @@ class RouteNotFoundError(TransportError):
 
 
 # Основные классы
+@_json_emitter(('vehicle_id', 'vehicle_id', int), ('model', 'model', str),
+               ('capacity', 'capacity', int), ('type', 'type', str))
 class Vehicle:
     """Класс транспортного средства"""
 
+    __slots__ = ('vehicle_id', 'model', 'capacity', 'type')
+
     def __init__(self, vehicle_id: int, model: str, capacity: int, vehicle_type: str):
 
         self.vehicle_id = vehicle_id
@@ -41,7 +139,6 @@ class Vehicle:
         self.capacity = capacity
         self.type = vehicle_type
 
-
     def to_dict(self) -> Dict:
         """Преобразование объекта в словарь"""
         return {
@@ -51,49 +148,106 @@ class Vehicle:
             'type': self.type
         }
 
+    def _to_xml(self, parent: ET.Element) -> ET.Element:
+        """Добавление XML-элемента объекта к родительскому"""
+        elem = ET.SubElement(parent, 'Vehicle')
+        ET.SubElement(elem, 'vehicle_id').text = str(self.vehicle_id)
+        ET.SubElement(elem, 'model').text = str(self.model)
+        ET.SubElement(elem, 'capacity').text = str(self.capacity)
+        ET.SubElement(elem, 'type').text = str(self.type)
+        return elem
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'Vehicle':
         """Создание объекта из словаря"""
-        return cls(
-            vehicle_id=data['vehicle_id'],
-            model=data['model'],
-            capacity=data['capacity'],
-            vehicle_type=data['type']
-        )
+        return cls(data['vehicle_id'], data['model'], data['capacity'], data['type'])
 
 
+@_json_emitter(('route_id', 'route_id', int), ('number', 'number', str),
+               ('start_point', 'start_point', str), ('end_point', 'end_point', str),
+               ('vehicles', '_vehicles_json', bytes))
 class Route:
     """Класс маршрута"""
 
+    __slots__ = ('route_id', 'number', 'start_point', 'end_point', '_vehicles', '_vehicle_pos')
+
     def __init__(self, route_id: int, number: str, start_point: str, end_point: str):
 
         self.route_id = route_id
         self.number = number
         self.start_point = start_point
         self.end_point = end_point
-        self.vehicles: List[Vehicle] = []
-
+        self._vehicles: List[Vehicle] = []
+        # Позиция транспортного средства в списке vehicles по его ID.
+        # Список доступен для изменения напрямую, поэтому позиция проверяется
+        # при каждом обращении (см. _vehicle_index)
+        self._vehicle_pos: Dict[int, int] = {}
+
+    @property
+    def vehicles(self) -> List[Vehicle]:
+        """Транспортные средства маршрута"""
+        return self._vehicles
+
+    @vehicles.setter
+    def vehicles(self, vehicles: List[Vehicle]) -> None:
+        vehicles = list(vehicles)
+        vehicle_pos = {vehicle.vehicle_id: index for index, vehicle in enumerate(vehicles)}
+        if len(vehicle_pos) != len(vehicles):
+            raise InvalidDataError("ID транспортных средств в маршруте должны быть уникальными")
+        self._vehicles = vehicles
+        self._vehicle_pos = vehicle_pos
 
     def add_vehicle(self, vehicle: Vehicle) -> None:
         """Добавление транспортного средства к маршруту"""
         if not isinstance(vehicle, Vehicle):
             raise InvalidDataError("Можно добавить только объект Vehicle")
-        self.vehicles.append(vehicle)
+        self._append_vehicle(vehicle)
+
+    def _vehicle_index(self, vehicle_id: int) -> Optional[int]:
+        """Позиция транспортного средства в списке; устаревший индекс перестраивается"""
+        vehicles = self._vehicles
+        index = self._vehicle_pos.get(vehicle_id)
+        if index is None or index >= len(vehicles) or vehicles[index].vehicle_id != vehicle_id:
+            # Обход с конца: при совпадающих ID остается позиция первого, как при линейном поиске
+            self._vehicle_pos = {vehicle.vehicle_id: i for i, vehicle in reversed(list(enumerate(vehicles)))}
+            index = self._vehicle_pos.get(vehicle_id)
+        return index
+
+    def _append_vehicle(self, vehicle: Vehicle) -> None:
+        """Добавление транспортного средства без проверки типа"""
+        index = self._vehicle_pos.get(vehicle.vehicle_id)
+        if (index is not None and index < len(self._vehicles)
+                and self._vehicles[index].vehicle_id == vehicle.vehicle_id):
+            raise InvalidDataError(f"Транспортное средство с ID {vehicle.vehicle_id} уже есть в маршруте")
+        self._vehicle_pos[vehicle.vehicle_id] = len(self._vehicles)
+        self._vehicles.append(vehicle)
 
     def remove_vehicle(self, vehicle_id: int) -> None:
-        """Удаление транспортного средства из маршрута"""
-        vehicle = self.find_vehicle(vehicle_id)
-        if vehicle:
-            self.vehicles.remove(vehicle)
+        """Удаление транспортного средства из маршрута (на его место встает последнее)"""
+        index = self._vehicle_index(vehicle_id)
+        if index is not None:
+            del self._vehicle_pos[vehicle_id]
+            last = self._vehicles.pop()
+            if index != len(self._vehicles):
+                self._vehicles[index] = last
+                self._vehicle_pos[last.vehicle_id] = index
         else:
             raise VehicleNotFoundError(f"Транспортное средство с ID {vehicle_id} не найдено в маршруте")
 
     def find_vehicle(self, vehicle_id: int) -> Optional[Vehicle]:
         """Поиск транспортного средства по ID"""
-        for vehicle in self.vehicles:
-            if vehicle.vehicle_id == vehicle_id:
-                return vehicle
-        return None
+        index = self._vehicle_index(vehicle_id)
+        if index is None:
+            return None
+        return self._vehicles[index]
+
+    @property
+    def _vehicles_json(self) -> bytes:
+        """JSON-массив транспорта маршрута (для _to_json_bytes)"""
+        if not self.vehicles:
+            return b'[]'
+        items = b',\n'.join(vehicle._to_json_bytes() for vehicle in self.vehicles)
+        return b'[\n    ' + items.replace(b'\n', b'\n    ') + b'\n  ]'
 
     def to_dict(self) -> Dict:
         """Преобразование объекта в словарь"""
@@ -105,17 +259,24 @@ class Route:
             'vehicles': [vehicle.to_dict() for vehicle in self.vehicles]
         }
 
+    def _to_xml(self, parent: ET.Element) -> ET.Element:
+        """Добавление XML-элемента объекта к родительскому"""
+        elem = ET.SubElement(parent, 'Route')
+        ET.SubElement(elem, 'route_id').text = str(self.route_id)
+        ET.SubElement(elem, 'number').text = str(self.number)
+        ET.SubElement(elem, 'start_point').text = str(self.start_point)
+        ET.SubElement(elem, 'end_point').text = str(self.end_point)
+        vehicles_elem = ET.SubElement(elem, 'Vehicles')
+        for vehicle in self.vehicles:
+            vehicle._to_xml(vehicles_elem)
+        return elem
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'Route':
         """Создание объекта из словаря"""
-        route = cls(
-            route_id=data['route_id'],
-            number=data['number'],
-            start_point=data['start_point'],
-            end_point=data['end_point']
-        )
+        route = cls(data['route_id'], data['number'], data['start_point'], data['end_point'])
         for vehicle_data in data.get('vehicles', []):
-            route.add_vehicle(Vehicle.from_dict(vehicle_data))
+            route._append_vehicle(Vehicle.from_dict(vehicle_data))
         return route
 
     def __str__(self) -> str:
@@ -123,15 +284,36 @@ class Route:
         return f"Маршрут {self.number}: {self.start_point} - {self.end_point} | Транспорт: [{vehicles_info}]"
 
 
+@_json_emitter(('passenger_id', 'passenger_id', int), ('name', 'name', str),
+               ('card_number', 'card_number', str))
 class Passenger:
     """Класс пассажира"""
 
+    __slots__ = ('passenger_id', 'name', '_card_number', '_card_width')
+
     def __init__(self, passenger_id: int, name: str, card_number: str):
 
         self.passenger_id = passenger_id
         self.name = name
         self.card_number = card_number
 
+    @property
+    def card_number(self):
+        """Номер карты в том виде, в котором он был задан"""
+        if self._card_width:
+            return f"{self._card_number:0{self._card_width}d}"
+        return self._card_number
+
+    @card_number.setter
+    def card_number(self, card_number) -> None:
+        # Цифровой номер карты хранится числом, ширина нужна для восстановления ведущих нулей
+        if isinstance(card_number, str) and card_number.isascii() and card_number.isdigit():
+            self._card_number = int(card_number)
+            self._card_width = len(card_number)
+        else:
+            self._card_number = card_number
+            self._card_width = 0
+
     def to_dict(self) -> Dict:
         """Преобразование объекта в словарь"""
         return {
@@ -140,22 +322,32 @@ class Passenger:
             'card_number': self.card_number
         }
 
+    def _to_xml(self, parent: ET.Element) -> ET.Element:
+        """Добавление XML-элемента объекта к родительскому"""
+        elem = ET.SubElement(parent, 'Passenger')
+        ET.SubElement(elem, 'passenger_id').text = str(self.passenger_id)
+        ET.SubElement(elem, 'name').text = str(self.name)
+        ET.SubElement(elem, 'card_number').text = str(self.card_number)
+        return elem
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'Passenger':
         """Создание объекта из словаря"""
-        return cls(
-            passenger_id=data['passenger_id'],
-            name=data['name'],
-            card_number=data['card_number']
-        )
+        return cls(data['passenger_id'], data['name'], data['card_number'])
 
     def __str__(self) -> str:
         return f"Пассажир: {self.name} (Карта: {self.card_number}, ID: {self.passenger_id})"
 
 
+@_json_emitter(('schedule_id', 'schedule_id', int), ('route_id', 'route_id', int),
+               ('departure_time', 'departure_time', str), ('arrival_time', 'arrival_time', str))
 class Schedule:
     """Класс расписания"""
 
+    # Время ЧЧ:ММ хранится в минутах от полуночи (*_minutes), любое другое значение - как задано (*_raw)
+    __slots__ = ('schedule_id', 'route_id', '_departure_minutes', '_departure_raw',
+                 '_arrival_minutes', '_arrival_raw')
+
     def __init__(self, schedule_id: int, route_id: int, departure_time: str, arrival_time: str):
 
         self.schedule_id = schedule_id
@@ -163,6 +355,40 @@ class Schedule:
         self.departure_time = departure_time
         self.arrival_time = arrival_time
 
+    @property
+    def departure_time(self):
+        """Время отправления в том виде, в котором оно было задано"""
+        if self._departure_minutes is not None:
+            return _minutes_to_time(self._departure_minutes)
+        return self._departure_raw
+
+    @departure_time.setter
+    def departure_time(self, departure_time) -> None:
+        self._departure_minutes = _time_to_minutes(departure_time)
+        self._departure_raw = None if self._departure_minutes is not None else departure_time
+
+    @property
+    def arrival_time(self):
+        """Время прибытия в том виде, в котором оно было задано"""
+        if self._arrival_minutes is not None:
+            return _minutes_to_time(self._arrival_minutes)
+        return self._arrival_raw
+
+    @arrival_time.setter
+    def arrival_time(self, arrival_time) -> None:
+        self._arrival_minutes = _time_to_minutes(arrival_time)
+        self._arrival_raw = None if self._arrival_minutes is not None else arrival_time
+
+    @property
+    def departure_minutes(self) -> Optional[int]:
+        """Время отправления в минутах от полуночи (None, если время не в формате ЧЧ:ММ)"""
+        return self._departure_minutes
+
+    @property
+    def arrival_minutes(self) -> Optional[int]:
+        """Время прибытия в минутах от полуночи (None, если время не в формате ЧЧ:ММ)"""
+        return self._arrival_minutes
+
     def to_dict(self) -> Dict:
         """Преобразование объекта в словарь"""
         return {
@@ -172,15 +398,19 @@ class Schedule:
             'arrival_time': self.arrival_time
         }
 
+    def _to_xml(self, parent: ET.Element) -> ET.Element:
+        """Добавление XML-элемента объекта к родительскому"""
+        elem = ET.SubElement(parent, 'Schedule')
+        ET.SubElement(elem, 'schedule_id').text = str(self.schedule_id)
+        ET.SubElement(elem, 'route_id').text = str(self.route_id)
+        ET.SubElement(elem, 'departure_time').text = str(self.departure_time)
+        ET.SubElement(elem, 'arrival_time').text = str(self.arrival_time)
+        return elem
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'Schedule':
         """Создание объекта из словаря"""
-        return cls(
-            schedule_id=data['schedule_id'],
-            route_id=data['route_id'],
-            departure_time=data['departure_time'],
-            arrival_time=data['arrival_time']
-        )
+        return cls(data['schedule_id'], data['route_id'], data['departure_time'], data['arrival_time'])
 
     def __str__(self) -> str:
         return f"Расписание ID {self.schedule_id}: {self.departure_time} - {self.arrival_time} (Маршрут ID: {self.route_id})"
@@ -193,13 +423,38 @@ class TransportSystem:
         self.routes: List[Route] = []
         self.passengers: List[Passenger] = []
         self.schedules: List[Schedule] = []
+        # Индексы для поиска по ID, списки сохраняют порядок для сериализации.
+        # Списки публичные, поэтому индекс проверяется при каждом попадании
+        # и перестраивается по списку, если устарел
+        self._routes_by_id: Dict[int, Route] = {}
+        self._passengers_by_id: Dict[int, Passenger] = {}
+
+    @staticmethod
+    def _indexed_lookup(index: Dict, items: List, id_attr: str, item_id: int):
+        """Поиск объекта по ID через индекс с перестройкой индекса при промахе"""
+        item = index.get(item_id)
+        if item is None or getattr(item, id_attr) != item_id:
+            index.clear()
+            # Обход с конца: при совпадающих ID в индексе остается первый объект, как при линейном поиске
+            for candidate in reversed(items):
+                index[getattr(candidate, id_attr)] = candidate
+            item = index.get(item_id)
+        return item
 
     # CRUD операции для маршрутов
     def create_route(self, route: Route) -> None:
         """Создание нового маршрута"""
         if not isinstance(route, Route):
             raise InvalidDataError("Можно добавить только объект Route")
+        self._append_route(route)
+
+    def _append_route(self, route: Route) -> None:
+        """Добавление маршрута без проверки типа (для доверенных путей загрузки)"""
+        existing = self._routes_by_id.get(route.route_id)
+        if existing is not None and existing.route_id == route.route_id:
+            raise InvalidDataError(f"Маршрут с ID {route.route_id} уже существует")
         self.routes.append(route)
+        self._routes_by_id[route.route_id] = route
 
     def read_route(self, route_id: int) -> Route:
         """Чтение маршрута по ID"""
@@ -219,54 +474,117 @@ class TransportSystem:
         """Удаление маршрута"""
         route = self.read_route(route_id)
         self.routes.remove(route)
+        self._routes_by_id.pop(route_id, None)
 
     def find_route(self, route_id: int):
         """Поиск маршрута по ID"""
-        for route in self.routes:
-            if route.route_id == route_id:
-                return route
-        return None
+        return self._indexed_lookup(self._routes_by_id, self.routes, 'route_id', route_id)
 
     def create_passenger(self, passenger: Passenger) -> None:
         """Создание нового пассажира"""
         if not isinstance(passenger, Passenger):
             raise InvalidDataError("Можно добавить только объект Passenger")
+        self._append_passenger(passenger)
+
+    def _append_passenger(self, passenger: Passenger) -> None:
+        """Добавление пассажира без проверки типа (для доверенных путей загрузки)"""
+        existing = self._passengers_by_id.get(passenger.passenger_id)
+        if existing is not None and existing.passenger_id == passenger.passenger_id:
+            raise InvalidDataError(f"Пассажир с ID {passenger.passenger_id} уже существует")
         self.passengers.append(passenger)
+        self._passengers_by_id[passenger.passenger_id] = passenger
 
     def read_passenger(self, passenger_id: int) -> Passenger:
         """Чтение пассажира по ID"""
-        for passenger in self.passengers:
-            if passenger.passenger_id == passenger_id:
-                return passenger
+        passenger = self._indexed_lookup(self._passengers_by_id, self.passengers, 'passenger_id', passenger_id)
+        if passenger:
+            return passenger
         raise TransportError(f"Пассажир с ID {passenger_id} не найден")
 
     # Работа с файлами JSON
     def save_to_json(self, filename: str) -> None:
         """Сохранение данных в JSON файл"""
         try:
-            data = {
-                'routes': [route.to_dict() for route in self.routes],
-                'passengers': [passenger.to_dict() for passenger in self.passengers],
-                'schedules': [schedule.to_dict() for schedule in self.schedules],
-            }
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Объекты пишутся по одному, без построения общего словаря всех данных
+            with _atomic_write(filename) as f:
+                f.write(b'{\n')
+                self._stream_array(f, 'routes', self.routes)
+                f.write(b',\n')
+                self._stream_array(f, 'passengers', self.passengers)
+                f.write(b',\n')
+                self._stream_array(f, 'schedules', self.schedules)
+                f.write(b'\n}')
         except Exception as e:
             raise FileOperationError(f"Ошибка сохранения JSON: {str(e)}")
 
+    @staticmethod
+    def _stream_array(f, name: str, items) -> None:
+        """Потоковая запись именованного JSON-массива объектов в файл"""
+        f.write(b'  "' + name.encode('utf-8') + b'": [')
+        separator = b'\n    '
+        for item in items:
+            f.write(separator)
+            if orjson is not None:
+                item_json = orjson.dumps(item.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                # Без orjson сгенерированный сериализатор быстрее json.dumps словаря
+                item_json = item._to_json_bytes()
+            f.write(item_json.replace(b'\n', b'\n    '))
+            separator = b',\n    '
+        if separator != b'\n    ':
+            f.write(b'\n  ')
+        f.write(b']')
+
     def load_from_json(self, filename: str) -> None:
         """Загрузка данных из JSON файла"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            self.routes = [Route.from_dict(route_data) for route_data in data.get('routes', [])]
-            self.passengers = [Passenger.from_dict(passenger_data) for passenger_data in data.get('passengers', [])]
-            self.schedules = [Schedule.from_dict(schedule_data) for schedule_data in data.get('schedules', [])]
+            loaded = TransportSystem()
+            if ijson is not None:
+                # Потоковый разбор: по проходу файла на каждый раздел,
+                # в памяти только текущий объект, а не весь документ
+                with open(filename, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                    def section(name: str):
+                        f.seek(0)
+                        events = _checked_json_events(ijson.parse(f, use_float=True), name)
+                        return ijson.items(events, name + '.item')
+
+                    loaded._fill_from_sections(section)
+            else:
+                if orjson is not None:
+                    with open(filename, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                        raw = f.read()
+                    data = orjson.loads(raw)
+                else:
+                    with open(filename, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                        raw = f.read()
+                    data = json.loads(raw)
+                del raw
+                if not isinstance(data, dict):
+                    raise InvalidDataError("Корневой элемент JSON должен быть объектом")
+
+                def section(name: str):
+                    items = data.get(name, [])
+                    if not isinstance(items, list):
+                        raise InvalidDataError(f"Раздел {name} должен быть массивом")
+                    return items
+
+                loaded._fill_from_sections(section)
+
+            self.routes, self._routes_by_id = loaded.routes, loaded._routes_by_id
+            self.passengers, self._passengers_by_id = loaded.passengers, loaded._passengers_by_id
+            self.schedules = loaded.schedules
 
         except Exception as e:
             raise FileOperationError(f"Ошибка загрузки JSON: {str(e)}")
 
+    def _fill_from_sections(self, section) -> None:
+        """Заполнение системы из разделов JSON (section(name) возвращает итерируемые словари)"""
+        for route_data in section('routes'):
+            self._append_route(Route.from_dict(route_data))
+        for passenger_data in section('passengers'):
+            self._append_passenger(Passenger.from_dict(passenger_data))
+        self.schedules = [Schedule.from_dict(schedule_data) for schedule_data in section('schedules')]
+
     # Работа с файлами XML
     def save_to_xml(self, filename: str) -> None:
         """Сохранение данных в XML файл"""
@@ -276,55 +594,42 @@ class TransportSystem:
             # Маршруты
             routes_elem = ET.SubElement(root, 'Routes')
             for route in self.routes:
-                route_elem = ET.SubElement(routes_elem, 'Route')
-                for key, value in route.to_dict().items():
-                    if key == 'vehicles':
-                        vehicles_elem = ET.SubElement(route_elem, 'Vehicles')
-                        for vehicle in value:
-                            vehicle_elem = ET.SubElement(vehicles_elem, 'Vehicle')
-                            for v_key, v_value in vehicle.items():
-                                ET.SubElement(vehicle_elem, v_key).text = str(v_value)
-                    else:
-                        ET.SubElement(route_elem, key).text = str(value)
+                route._to_xml(routes_elem)
 
             # Пассажиры
             passengers_elem = ET.SubElement(root, 'Passengers')
             for passenger in self.passengers:
-                passenger_elem = ET.SubElement(passengers_elem, 'Passenger')
-                for key, value in passenger.to_dict().items():
-                    ET.SubElement(passenger_elem, key).text = str(value)
+                passenger._to_xml(passengers_elem)
 
             # Расписания
             schedules_elem = ET.SubElement(root, 'Schedules')
             for schedule in self.schedules:
-                schedule_elem = ET.SubElement(schedules_elem, 'Schedule')
-                for key, value in schedule.to_dict().items():
-                    ET.SubElement(schedule_elem, key).text = str(value)
+                schedule._to_xml(schedules_elem)
 
             # Форматирование и сохранение
-            xml_str = minidom.parseString(ET.tostring(root)).toprettyxml(indent="  ")
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(xml_str)
+            ET.indent(root, space="  ")
+            with _atomic_write(filename) as f:
+                ET.ElementTree(root).write(f, encoding='utf-8', xml_declaration=True)
+                f.write(b'\n')
         except Exception as e:
             raise FileOperationError(f"Ошибка сохранения XML: {str(e)}")
 
     def display_all_data(self) -> None:
         """Отображение всех данных системы"""
-        print("\n" + "=" * 50)
-        print("ДАННЫЕ ТРАНСПОРТНОЙ СИСТЕМЫ")
-        print("=" * 50)
+        # Отчет собирается целиком и выводится одной записью
+        lines = ["", "=" * 50, "ДАННЫЕ ТРАНСПОРТНОЙ СИСТЕМЫ", "=" * 50]
+
+        lines.append("\nМАРШРУТЫ:")
+        lines.extend(f"  {route}" for route in self.routes)
 
-        print("\nМАРШРУТЫ:")
-        for route in self.routes:
-            print(f"  {route}")
+        lines.append("\nПАССАЖИРЫ:")
+        lines.extend(f"  {passenger}" for passenger in self.passengers)
 
-        print("\nПАССАЖИРЫ:")
-        for passenger in self.passengers:
-            print(f"  {passenger}")
+        lines.append("\nРАСПИСАНИЯ:")
+        lines.extend(f"  {schedule}" for schedule in self.schedules)
 
-        print("\nРАСПИСАНИЯ:")
-        for schedule in self.schedules:
-            print(f"  {schedule}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 
 # Демонстрация работы